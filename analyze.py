@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import os
-import json
 import csv
+import orjson
 from collections import Counter, defaultdict
 from urllib.parse import urlparse
 from rich.console import Console
@@ -11,50 +11,58 @@ from rich.text import Text
 
 console = Console()
 
+# values that mark a record as sensitive (jsonl keeps bools, csv keeps strings)
+SENSITIVE_TRUE = {True, "True", "true"}
+# above this many rows the detailed list is printed as plain lines, not a rich table
+DETAILED_TABLE_LIMIT = 500
+# number of plain lines handed to the console per print call
+DETAILED_CHUNK_SIZE = 1000
+
 def load_jsonl(path):
     """
-    loads dork scan results from a .jsonl file.
+    streams dork scan results from a .jsonl file, one record at a time.
     """
-    results = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             try:
-                results.append(json.loads(line.strip()))
-            except json.JSONDecodeError:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
                 continue
-    return results
 
 def load_csv(path):
     """
-    loads dork scan results from a .csv file.
+    streams dork scan results from a .csv file, one record at a time.
     """
-    results = []
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            results.append(row)
-    return results
+        yield from csv.DictReader(f)
 
 def analyze(results):
     """
     analyzes the dork scan results and prints summaries.
+    results can be any iterable of records; it is consumed in a single pass.
     """
     stats = defaultdict(int)
     category_counter = Counter()
     sensitive_counter = 0
     domain_counter = Counter()
+    rows = []
 
-    # process all results to gather summary statistics
+    # gather summary statistics and the detailed rows in one pass
     for r in results:
         stats["total_results"] += 1
-        cat = r.get("category", "unknown").lower()
-        category_counter[cat] += 1
-        if r.get("sensitive_hint") in [True, "True"]:
+        category = (r.get("category") or "unknown").lower()
+        category_counter[category] += 1
+        sensitive = r.get("sensitive_hint") in SENSITIVE_TRUE
+        if sensitive:
             sensitive_counter += 1
         url = r.get("url")
         if url:
-            domain = urlparse(url).netloc.lower()
-            domain_counter[domain] += 1
+            domain_counter[urlparse(url).netloc.lower()] += 1
+        rows.append((category, r.get("dork") or "unknown", url or "no url", sensitive))
+
+    if not rows:
+        console.print("[yellow]file is empty or invalid.[/yellow]")
+        return
 
     # print summary statistics using rich panels
     console.print(Panel(f"[bold green]total results: {stats['total_results']}[/bold green]\n"
@@ -76,24 +84,39 @@ def analyze(results):
 
     # print detailed results list
     console.print(Panel.fit("[bold cyan]detailed results list[/bold cyan]"))
+    if len(rows) > DETAILED_TABLE_LIMIT:
+        print_detailed_lines(rows)
+        return
+
     detailed_table = Table(show_header=True, header_style="bold bright_blue")
     detailed_table.add_column("category", style="cyan")
     detailed_table.add_column("dork", style="magenta")
     detailed_table.add_column("url", style="green")
     
-    for r in results:
-        category = r.get("category", "unknown")
-        dork = r.get("dork", "unknown")
-        url = r.get("url", "no url")
-        
+    for category, dork, url, sensitive in rows:
         # add a hint for sensitive data if it exists
-        if r.get("sensitive_hint"):
+        if sensitive:
             url = f"[bold red]sensitive data: {url}[/bold red]"
             
         detailed_table.add_row(category, dork, url)
         
     console.print(detailed_table)
 
+def print_detailed_lines(rows):
+    """
+    prints the detailed results as one line per row, in chunks.
+    rich tables get very slow to lay out with thousands of rows.
+    """
+    for start in range(0, len(rows), DETAILED_CHUNK_SIZE):
+        lines = []
+        for category, dork, url, sensitive in rows[start:start + DETAILED_CHUNK_SIZE]:
+            if sensitive:
+                url_part = (f"sensitive data: {url}", "bold red")
+            else:
+                url_part = (url, "green")
+            lines.append(Text.assemble((category, "cyan"), "  ", (dork, "magenta"), "  ", url_part))
+        console.print(Text("\n").join(lines))
+
 
 def main():
     """
@@ -103,7 +126,6 @@ def main():
     jsonl_path = "gds_output/results.jsonl"
     csv_path = "gds_output/results.csv"
 
-    results = []
     if os.path.exists(jsonl_path):
         console.print(f"[green]jsonl file loaded: {jsonl_path}[/green]")
         results = load_jsonl(jsonl_path)
@@ -114,10 +136,6 @@ def main():
         console.print("[red]results file not found![/red]")
         return
 
-    if not results:
-        console.print("[yellow]file is empty or invalid.[/yellow]")
-        return
-
     analyze(results)
 
 if __name__ == "__main__":
@@ -1,23 +1,28 @@
 import argparse
 import asyncio
-import json
+import codecs
 import csv
+import hashlib
+import math
 import os
+import random
 import re
 import time
-import aiohttp
-import socks
-import socket
+from collections import deque
+from contextlib import asynccontextmanager
+import orjson
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+# aiohttp, aiohttp_socks, selectolax and rich are imported where they are used,
+# so parsing arguments (and --help) doesn't pay for them
 
 # default configuration
 DEFAULT_CONCURRENCY = 6
 DEFAULT_DELAY = 1.5
+# max snapshot fetches in flight across all dorks
+SNAPSHOT_CONCURRENCY = 10
+# resolved hostnames are cached for this many seconds
+DNS_CACHE_TTL = 600
+LIMIT_PER_HOST = 16
 # updated user-agent to mimic a real browser
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 # added more headers to better mimic a real browser request
@@ -29,8 +34,48 @@ HEADERS = {
     "Connection": "keep-alive"
 }
 DUCKDUCKGO_HTML = "https://html.duckduckgo.com/html/"
+DUCKDUCKGO_HOST = "html.duckduckgo.com"
+GOOGLE_CSE_URL = "https://www.googleapis.com/customsearch/v1"
+GOOGLE_CSE_HOST = "www.googleapis.com"
+# status codes search backends use to tell us to slow down
+THROTTLE_STATUSES = (403, 429)
+# how often a throttled duckduckgo query is retried after backing off
+THROTTLE_RETRIES = 3
+# backoff after a throttling response doubles from the base up to the cap (seconds);
+# the cap also bounds jitter and Retry-After
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 300.0
+# a category is aborted when more than half of the last ERROR_WINDOW search responses were throttled
+ERROR_WINDOW = 20
+# pause after aborting a category before the next one starts (seconds)
+STORM_PAUSE = 60.0
+# columns of results.csv; the header is written once when the file is created
+CSV_HEADER = ["timestamp","category","dork","query","url","status","title","sensitive_hint","error"]
+# seen urls are kept exactly up to this many, then moved into a bloom filter
+SEEN_URLS_EXACT_LIMIT = 50000
+# the bloom filter is sized for this many urls at this false positive rate
+SEEN_URLS_BLOOM_CAPACITY = 1000000
+SEEN_URLS_BLOOM_ERROR_RATE = 1e-5
+# output files are flushed to disk after this many records
+FLUSH_EVERY = 50
+OUTPUT_BUFFER_SIZE = 1 << 16
+# snapshots only read this many bytes of each page; the title and snippet live up front
+SNAPSHOT_READ_BYTES = 16384
+
+# console that imports rich and creates itself on first use
+class LazyConsole:
+    """
+    Proxy for rich's Console that is only created when first used.
+    """
+    _console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
 
-console = Console()
+console = LazyConsole()
 
 # loads dorks from a json file
 def load_dorks(path="dorks.json"):
@@ -41,8 +86,8 @@ def load_dorks(path="dorks.json"):
         console.print(f"[red][!] dorks file '{path}' not found. please create it and add dorks.[/red]")
         return {}
     
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
     normalized = {}
     for k, v in data.items():
         if isinstance(v, list):
@@ -68,54 +113,233 @@ def safe_filename(name):
     """
     return re.sub(r"[^a-zA-Z0-9_-]", "_", name)
 
+# url deduplication that stops growing with long scans
+class SeenUrls:
+    """
+    Set-like store of urls already reported.
+    Keeps an exact set until SEEN_URLS_EXACT_LIMIT urls, then switches to a
+    fixed-size bloom filter so memory no longer grows with the scan.
+    """
+    def __init__(self):
+        self._exact = set()
+        self._bits = None
+        self._num_bits = 0
+        self._num_hashes = 0
+
+    def _positions(self, url):
+        """
+        Returns the bloom filter bit positions of a url.
+        """
+        digest = hashlib.blake2b(url.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def _to_bloom(self):
+        """
+        Moves the exact set into a newly allocated bloom filter.
+        """
+        self._num_bits = math.ceil(-SEEN_URLS_BLOOM_CAPACITY * math.log(SEEN_URLS_BLOOM_ERROR_RATE) / math.log(2) ** 2)
+        self._num_hashes = max(1, round(self._num_bits / SEEN_URLS_BLOOM_CAPACITY * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        exact, self._exact = self._exact, None
+        for url in exact:
+            self.add(url)
+
+    def __contains__(self, url):
+        """
+        Checks whether a url was already seen.
+        """
+        if self._bits is None:
+            return url in self._exact
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(url))
+
+    def add(self, url):
+        """
+        Marks a url as seen.
+        """
+        if self._bits is None:
+            self._exact.add(url)
+            if len(self._exact) > SEEN_URLS_EXACT_LIMIT:
+                self._to_bloom()
+            return
+        for p in self._positions(url):
+            self._bits[p >> 3] |= 1 << (p & 7)
+
+    def update(self, urls):
+        """
+        Marks several urls as seen.
+        """
+        for url in urls:
+            self.add(url)
+
+class ThrottleStorm(RuntimeError):
+    """
+    Raised when search backends throttle most recent requests.
+    """
+
+# per-host request pacing with backoff
+class RateLimiter:
+    """
+    Spaces requests to each host at least min_interval seconds apart.
+    When a host answers with a throttling status, the host is paused with
+    exponential backoff (or for its Retry-After) before the next request.
+    """
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._locks = {}
+        self._next_at = {}
+        self._backoff = {}
+        self.outcomes = deque(maxlen=ERROR_WINDOW)
+
+    @asynccontextmanager
+    async def acquire(self, host):
+        """
+        Waits until a request to host is allowed.
+        """
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._next_at.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_at[host] = time.monotonic() + self.min_interval
+        yield
+
+    def throttled(self, host, retry_after=None):
+        """
+        Pauses host after a throttling response and returns the pause in seconds.
+        """
+        self.outcomes.append(True)
+        backoff = self._backoff.get(host, BACKOFF_BASE)
+        self._backoff[host] = min(backoff * 2, BACKOFF_MAX)
+        pause = retry_after if retry_after is not None else backoff + random.uniform(0, backoff / 10)
+        pause = min(pause, BACKOFF_MAX)
+        self._next_at[host] = max(self._next_at.get(host, 0.0), time.monotonic() + pause)
+        return pause
+
+    def succeeded(self, host):
+        """
+        Resets the backoff of host after a successful response.
+        """
+        self.outcomes.append(False)
+        self._backoff.pop(host, None)
+
+    def is_storming(self):
+        """
+        Checks whether most of the recent search responses were throttled.
+        """
+        return len(self.outcomes) == self.outcomes.maxlen and sum(self.outcomes) * 2 > self.outcomes.maxlen
+
+def retry_after_seconds(resp):
+    """
+    Returns the Retry-After header of a response in seconds, if it is a finite number.
+    """
+    try:
+        value = float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+    if not math.isfinite(value):
+        return None
+    return max(value, 0.0)
+
+class GoogleCseUnavailable(RuntimeError):
+    """
+    Raised when google cse refuses requests for the rest of the run.
+    """
+
+def parse_cse_error(text):
+    """
+    Returns the error message of a google cse error body and whether it
+    reports the daily quota as used up.
+    """
+    try:
+        error = orjson.loads(text).get("error", {})
+    except (orjson.JSONDecodeError, AttributeError):
+        return text[:200], False
+    message = error.get("message", "unknown api error.")
+    reasons = {e.get("reason") for e in error.get("errors", []) if isinstance(e, dict)}
+    daily = "dailyLimitExceeded" in reasons or "per day" in message.lower()
+    return message, daily
+
 # google custom search api query
-async def google_cse_search(session, api_key, cx, q, num=10):
+async def google_cse_search(session, api_key, cx, q, num=10, limiter=None):
     """
     Performs a search using the Google Custom Search API.
+    Raises GoogleCseUnavailable on 403 or an exhausted daily quota; a
+    rate-limit 429 pauses the host and raises RuntimeError for this query only.
     """
-    url = "https://www.googleapis.com/customsearch/v1"
+    import aiohttp
+    limiter = limiter or RateLimiter(0)
     params = {"key": api_key, "cx": cx, "q": q, "num": min(num, 10)}
     try:
-        async with session.get(url, params=params, timeout=30) as resp:
+        async with limiter.acquire(GOOGLE_CSE_HOST), session.get(GOOGLE_CSE_URL, params=params, timeout=30) as resp:
             if resp.status != 200:
                 text = await resp.text()
-                if resp.status == 400:
-                    error_message = json.loads(text).get("error", {}).get("message", "unknown api error.")
+                if resp.status in (400, 403, 429):
+                    error_message, daily = parse_cse_error(text)
+                    if resp.status == 403 or (resp.status == 429 and daily):
+                        raise GoogleCseUnavailable(f"google cse api error ({resp.status}): {error_message}")
+                    if resp.status == 429:
+                        pause = limiter.throttled(GOOGLE_CSE_HOST, retry_after_seconds(resp))
+                        raise RuntimeError(f"google cse api rate limited ({resp.status}): {error_message} - pausing it for {pause:.0f}s")
                     raise RuntimeError(f"google cse api error ({resp.status}): {error_message}")
                 raise RuntimeError(f"google cse api returned an unexpected status code: {resp.status} - {text[:200]}")
             
+            limiter.succeeded(GOOGLE_CSE_HOST)
             return await resp.json()
     except aiohttp.ClientError as e:
         raise RuntimeError(f"network error: {e}")
 
-# duckduckgo html scraping - no retries on forbidden
-async def duckduckgo_search(session, q, num=10):
+# duckduckgo html scraping - backs off and retries when throttled
+async def duckduckgo_search(session, q, num=10, limiter=None):
     """
     Scrapes DuckDuckGo's HTML page for search results.
-    If a 403 Forbidden error is encountered, it stops immediately.
+    On 403/429 the host is paused with exponential backoff and the query
+    is retried up to THROTTLE_RETRIES times.
     """
+    import aiohttp
+    from selectolax.parser import HTMLParser
+    limiter = limiter or RateLimiter(0)
     url = DUCKDUCKGO_HTML + "?q=" + quote_plus(q)
     
-    try:
-        async with session.get(url, headers=HEADERS, timeout=30) as resp:
-            # Check for 403 Forbidden status code
-            if resp.status == 403:
-                console.print(f"[red][!] Network error: 403 Forbidden. DuckDuckGo may be blocking automated requests.[/red]")
-                return [] # Return an empty list immediately
-
-            resp.raise_for_status()  # raise for other HTTP errors
-            text = await resp.text()
-    except aiohttp.ClientError as e:
-        console.print(f"[red][!] Network error: {e}[/red]")
-        return [] # Return an empty list on other network errors
+    text = None
+    for _ in range(THROTTLE_RETRIES + 1):
+        try:
+            async with limiter.acquire(DUCKDUCKGO_HOST), session.get(url, headers=HEADERS, timeout=30) as resp:
+                # Check for throttling status codes
+                if resp.status in THROTTLE_STATUSES:
+                    pause = limiter.throttled(DUCKDUCKGO_HOST, retry_after_seconds(resp))
+                    console.print(f"[red][!] Network error: {resp.status}. DuckDuckGo may be blocking automated requests, backing off {pause:.0f}s.[/red]")
+                    continue
+
+                resp.raise_for_status()  # raise for other HTTP errors
+                text = await resp.text()
+                limiter.succeeded(DUCKDUCKGO_HOST)
+                break
+        except aiohttp.ClientError as e:
+            console.print(f"[red][!] Network error: {e}[/red]")
+            return [] # Return an empty list on other network errors
+
+    if text is None:
+        console.print(f"[red][!] DuckDuckGo is still throttling after {THROTTLE_RETRIES} retries, skipping query.[/red]")
+        return []
+
+    # pages without any result markup need no parsing
+    if 'class="result' not in text:
+        console.print(f"[yellow][!] No results found on the page.[/yellow]")
+        return []
             
-    soup = BeautifulSoup(text, "html.parser")
+    # both lookups below run on this single parsed tree
+    tree = HTMLParser(text)
     links = []
+    # set mirror of links for constant-time duplicate checks; links keeps page order
+    seen = set()
     
     # Attempt 1: Look for the 'result__url' class, as seen in the user's screenshot.
-    for a_tag in soup.find_all("a", class_="result__url", href=True):
-        link = a_tag["href"]
-        if link.startswith("http") and link not in links:
+    for a_tag in tree.css("a.result__url[href]"):
+        link = a_tag.attributes.get("href") or ""
+        if link.startswith("http") and link not in seen:
+            seen.add(link)
             links.append(link)
     
     if links:
@@ -123,11 +347,12 @@ async def duckduckgo_search(session, q, num=10):
         return links[:num]
     
     # Attempt 2: A more general search for links within result containers.
-    for result_div in soup.find_all("div", class_="result"):
-        a_tag = result_div.find("a", href=True)
-        if a_tag and a_tag.get("href"):
-            link = a_tag["href"]
-            if link.startswith("http") and link not in links:
+    for result_div in tree.css("div.result"):
+        a_tag = result_div.css_first("a[href]")
+        if a_tag and a_tag.attributes.get("href"):
+            link = a_tag.attributes["href"]
+            if link.startswith("http") and link not in seen:
+                seen.add(link)
                 links.append(link)
     
     if links:
@@ -137,63 +362,83 @@ async def duckduckgo_search(session, q, num=10):
     console.print(f"[yellow][!] No results found on the page.[/yellow]")
     return []
 
+# picks a usable text encoding for a response
+def response_encoding(resp):
+    """
+    Returns the charset declared by a response, or utf-8 if it is missing or unknown.
+    """
+    encoding = resp.charset or "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+    return encoding
+
 # fetches page content and metadata
 async def fetch_page(session, url, timeout=30):
     """
     Fetches the content of a given URL and extracts metadata.
+    Sets sensitive_hint when the page head contains sensitive keywords.
     """
+    from selectolax.parser import HTMLParser
     headers = {"User-Agent": USER_AGENT}
     try:
         async with session.get(url, headers=headers, timeout=timeout, allow_redirects=True) as resp:
             resp.raise_for_status()
-            text = await resp.text(errors="ignore")
+            raw = b""
+            while len(raw) < SNAPSHOT_READ_BYTES:
+                chunk = await resp.content.read(SNAPSHOT_READ_BYTES - len(raw))
+                if not chunk:
+                    break
+                raw += chunk
+            text = raw.decode(response_encoding(resp), errors="ignore")
             title = None
             try:
-                soup = BeautifulSoup(text, "html.parser")
-                if soup.title:
-                    title = soup.title.string.strip()
+                title_node = HTMLParser(text).css_first("title")
+                if title_node:
+                    title = title_node.text(strip=True) or None
             except Exception:
                 title = None
-            return {"url": str(resp.url), "status": resp.status, "title": title, "content_snippet": text[:2000]}
+            snap = {"url": str(resp.url), "status": resp.status, "title": title, "content_snippet": text[:2000]}
+            # scan the whole raw head, not just the decoded snippet
+            if find_sensitive_in_text(raw):
+                snap["sensitive_hint"] = True
+            return snap
     except Exception as e:
         return {"url": url, "status": "error", "error": str(e) or "unknown error"}
 
+# google-re2 scans in linear time; fall back to the stdlib engine if it isn't installed
+try:
+    import re2 as sensitive_re
+except ImportError:
+    sensitive_re = re
+
 # regex for sensitive content detection
-SENSITIVE_REGEX = re.compile(
-    r"(password|passwd|pwd|aws_access_key_id|aws_secret_access_key|private key|BEGIN PRIVATE KEY|api_key|access_token)", re.I
-)
+SENSITIVE_PATTERN = r"(?i)(password|passwd|pwd|aws_access_key_id|aws_secret_access_key|private key|BEGIN PRIVATE KEY|api_key|access_token)"
+SENSITIVE_REGEX = sensitive_re.compile(SENSITIVE_PATTERN)
+# bytes variant, used on raw page bodies before they are decoded
+SENSITIVE_BYTES_REGEX = sensitive_re.compile(SENSITIVE_PATTERN.encode())
 
 def find_sensitive_in_text(text):
     """
-    Checks for sensitive keywords in a given text string.
+    Checks for sensitive keywords in a given text string or raw bytes.
     """
-    return bool(text and SENSITIVE_REGEX.search(text))
+    if not text:
+        return False
+    regex = SENSITIVE_BYTES_REGEX if isinstance(text, bytes) else SENSITIVE_REGEX
+    return bool(regex.search(text))
 
-# create a TCP connector with socks proxy support
-def create_socks_connector(host, port, ssl_verify):
+# dns resolver for direct (non-tor) connections
+def create_resolver():
     """
-    Creates an aiohttp.TCPConnector that uses a SOCKS proxy.
+    Returns an aiodns-backed resolver if aiodns is installed, otherwise None
+    so aiohttp uses its default threaded resolver.
     """
-    conn = aiohttp.TCPConnector(ssl=ssl_verify)
-
-    # Wrap the connect method to use socks proxy
-    async def connect(req, *args, **kwargs):
-        sock = socks.socksocket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.set_proxy(socks.SOCKS5, host, port)
-        await asyncio.get_event_loop().sock_connect(sock, (req.url.host, req.url.port))
-        
-        # Manually create a new connector with the established socket
-        conn_with_sock = aiohttp.TCPConnector(ssl=ssl_verify)
-        
-        # Override the request's connection to use our new socket
-        req.conn = aiohttp.TCPConnector(ssl=ssl_verify)
-        req.conn._socket = sock
-        return await conn_with_sock.connect(req, *args, **kwargs)
-
-    # Monkey patch the connector's _connect method
-    conn._connect = connect
-    return conn
-
+    try:
+        from aiohttp.resolver import AsyncResolver
+        return AsyncResolver()
+    except (ImportError, RuntimeError):
+        return None
 
 # main scanner class
 class Scanner:
@@ -203,11 +448,15 @@ class Scanner:
     def __init__(self, args, dorks):
         self.args = args
         self.dorks = dorks
-        self.sem = asyncio.Semaphore(args.concurrency)
-        self.results = []
-        self.seen_urls = set()
+        # asyncio primitives are created in run(), inside the event loop (python 3.9 binds them at creation)
+        self.sem = None
+        self.snapshot_sem = None
+        self.limiter = RateLimiter(args.delay)
+        self.cse_enabled = bool(args.google_api_key and args.google_cx)
+        self.seen_urls = SeenUrls()
         self.start_time = time.time()
         self._ensure_output_files()
+        self.output_ready = self._open_output_files()
 
     def _ensure_output_files(self):
         """
@@ -225,30 +474,64 @@ class Scanner:
             except Exception as e:
                 console.print(f"[red][!] error creating jsonl file: {e}[/red]")
         
-        header = ["timestamp","category","dork","query","url","status","title","sensitive_hint","error"]
         if not os.path.exists(csv_path):
             try:
                 with open(csv_path, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
-                    writer.writerow(header)
+                    writer.writerow(CSV_HEADER)
                 console.print(f"[green][✓] csv file '{csv_path}' created with headers.[/green]")
             except Exception as e:
                 console.print(f"[red][!] error creating csv file: {e}[/red]")
 
+    def _open_output_files(self):
+        """
+        Opens the output files once for appending, so records don't reopen them.
+        Returns False if they can't be opened.
+        """
+        outdir = self.args.output_dir
+        self._pending = 0
+        self._jsonl_fh = None
+        self._csv_fh = None
+        try:
+            self._jsonl_fh = open(os.path.join(outdir, "results.jsonl"), "ab", buffering=OUTPUT_BUFFER_SIZE)
+            self._csv_fh = open(os.path.join(outdir, "results.csv"), "a", newline="", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE)
+        except Exception as e:
+            console.print(f"[red][!] error opening output files in '{outdir}': {e}[/red]")
+            self.close()
+            return False
+        self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=CSV_HEADER, extrasaction="ignore")
+        return True
+
+    def close(self):
+        """
+        Flushes and closes the output files.
+        """
+        for fh in (self._jsonl_fh, self._csv_fh):
+            if fh is None:
+                continue
+            try:
+                fh.close()
+            except Exception as e:
+                console.print(f"[red][!] error closing {fh.name}: {e}[/red]")
+
     async def run(self):
         """
         Runs the main dork scanning logic.
         """
+        import aiohttp
+        self.sem = asyncio.Semaphore(self.args.concurrency)
+        self.snapshot_sem = asyncio.Semaphore(SNAPSHOT_CONCURRENCY)
         # Use a ProxyConnector from aiohttp_socks if the --tor flag is set
         if self.args.tor:
             try:
-                connector = create_socks_connector("127.0.0.1", self.args.tor_port, not self.args.ignore_ssl)
+                from aiohttp_socks import ProxyConnector
+                connector = ProxyConnector.from_url(f"socks5://127.0.0.1:{self.args.tor_port}", rdns=True, ssl=not self.args.ignore_ssl)
                 console.print(f"[yellow][*] using tor proxy at 127.0.0.1:{self.args.tor_port}.[/yellow]")
             except Exception as e:
                 console.print(f"[red][!] Error creating ProxyConnector: {e}. Please check your aiohttp_socks installation and proxy settings.[/red]")
                 return
         else:
-            connector = aiohttp.TCPConnector(ssl=not self.args.ignore_ssl)
+            connector = aiohttp.TCPConnector(ssl=not self.args.ignore_ssl, resolver=create_resolver(), use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL, limit_per_host=LIMIT_PER_HOST)
 
         timeout = aiohttp.ClientTimeout(total=60)
         async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
@@ -258,6 +541,8 @@ class Scanner:
                 console.print("[red][!] no dorks found. please check your dorks.json file.[/red]")
                 return
 
+            # set after a category is aborted; the pause runs only if another category follows
+            storm_pause_pending = False
             for cat in categories:
                 if cat not in self.dorks:
                     console.print(f"[red][!] category '{cat}' not found, skipping.[/red]")
@@ -272,38 +557,66 @@ class Scanner:
                     console.print(f"[yellow][!] category '{cat}' has an empty dork list, skipping.[/yellow]")
                     continue
 
+                if storm_pause_pending:
+                    console.print(f"[yellow][*] pausing {STORM_PAUSE:.0f}s before category '{cat}' to let the search backends recover.[/yellow]")
+                    await asyncio.sleep(STORM_PAUSE)
+                    storm_pause_pending = False
+
                 console.print(f"[green][+] running category '{cat}' ({len(dork_list)} dorks).[/green]")
+                tasks = []
                 for dork in dork_list:
                     query = f"site:{self.args.target} {dork}" if self.args.target else dork
-                    await asyncio.sleep(self.args.delay)
-                    await self._run_single_dork(session, cat, dork, query)
+                    tasks.append(asyncio.create_task(self._run_single_dork(session, cat, dork, query)))
+                try:
+                    await asyncio.gather(*tasks)
+                except ThrottleStorm:
+                    # cancel the dorks still queued or in flight instead of letting them hit a blocked backend
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    skipped = sum(task.cancelled() or task.exception() is not None for task in tasks)
+                    console.print(f"[red][!] search backends are throttling most requests, aborted category '{cat}' ({skipped} dorks skipped).[/red]")
+                    self.limiter.outcomes.clear()
+                    storm_pause_pending = True
+
+    def _check_storm(self):
+        """
+        Raises ThrottleStorm when the search backends are throttling most requests.
+        """
+        if self.limiter.is_storming():
+            raise ThrottleStorm("search backends are throttling most requests")
 
     async def _run_single_dork(self, session, category, dork, query):
         """
         Executes a single dork query and processes the results.
         """
         async with self.sem:
+            self._check_storm()
             console.print(f"[cyan][dork][/cyan] {dork}  -> [white]{query}[/white]")
             
             all_hits = []
             
             # Check for Google API key and CX code
-            if self.args.google_api_key and self.args.google_cx:
+            if self.cse_enabled:
                 try:
                     console.print(f"[yellow][*] trying google cse api...[/yellow]")
-                    cse = await google_cse_search(session, self.args.google_api_key, self.args.google_cx, query, num=self.args.num)
+                    cse = await google_cse_search(session, self.args.google_api_key, self.args.google_cx, query, num=self.args.num, limiter=self.limiter)
                     if cse and "items" in cse:
                         all_hits.extend([it.get("link") for it in cse["items"] if it.get("link")])
                     if not all_hits:
                         console.print(f"[yellow][!] google cse returned no results, falling back to duckduckgo.[/yellow]")
+                except GoogleCseUnavailable as e:
+                    self.cse_enabled = False
+                    console.print(f"[red][!] {e} - google cse disabled for the rest of the run, using duckduckgo.[/red]")
                 except Exception as e:
                     console.print(f"[red][!] google cse error: {e} - falling back to duckduckgo.[/red]")
             
             # Fallback to DuckDuckGo if no Google API hits or if credentials are not provided
             if not all_hits or not self.args.google_api_key:
+                self._check_storm()
                 try:
                     console.print(f"[yellow][*] trying duckduckgo search...[/yellow]")
-                    duckduckgo_hits = await duckduckgo_search(session, query, num=100)
+                    duckduckgo_hits = await duckduckgo_search(session, query, num=100, limiter=self.limiter)
                     all_hits.extend(duckduckgo_hits)
                 except Exception as e:
                     console.print(f"[red][!] duckduckgo error: {str(e) or 'unknown error'}[/red]")
@@ -322,47 +635,45 @@ class Scanner:
             hits_to_process = new_hits[:self.args.num]
 
             if hits_to_process:
-                for url in hits_to_process:
-                    record = {"timestamp": time.time(), "category": category, "dork": dork, "query": query, "url": url}
-                    if self.args.snapshot:
-                        snap = await fetch_page(session, url)
+                records = [{"timestamp": time.time(), "category": category, "dork": dork, "query": query, "url": url} for url in hits_to_process]
+                if self.args.snapshot:
+                    snaps = await asyncio.gather(*(self._snapshot(session, url) for url in hits_to_process))
+                    for record, snap in zip(records, snaps):
                         record.update(snap)
-                        if find_sensitive_in_text(record.get("content_snippet", "")):
-                            record["sensitive_hint"] = True
-                    self.results.append(record)
+                for record in records:
                     self._dump_record(record)
+                console.print(f"[green][✓] {len(hits_to_process)} records saved.[/green]")
             else:
                  console.print(f"[yellow][!] no new results found for the query: {query}[/yellow]")
 
             await asyncio.sleep(0.2)
 
+    async def _snapshot(self, session, url):
+        """
+        Fetches a page snapshot, bounded by the snapshot semaphore.
+        """
+        async with self.snapshot_sem:
+            return await fetch_page(session, url)
+
     def _dump_record(self, record):
         """
         Appends a record to the output files.
         """
-        outdir = self.args.output_dir
-        jsonl_path = os.path.join(outdir, "results.jsonl")
-        csv_path = os.path.join(outdir, "results.csv")
-        
         try:
-            with open(jsonl_path, "a", encoding="utf-8") as fh:
-                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
-            console.print(f"[green][✓] jsonl entry added: {record['url']}[/green]")
+            self._jsonl_fh.write(orjson.dumps(record) + b"\n")
         except Exception as e:
-            console.print(f"[red][!] error writing to jsonl ({jsonl_path}): {e}[/red]")
+            console.print(f"[red][!] error writing to jsonl ({self._jsonl_fh.name}): {e}[/red]")
             
-        header = ["timestamp","category","dork","query","url","status","title","sensitive_hint","error"]
-        write_header = not os.path.exists(csv_path)
         try:
-            with open(csv_path, "a", newline="", encoding="utf-8") as cf:
-                writer = csv.writer(cf)
-                if write_header:
-                    writer.writerow(header)
-                row = [record.get(h) for h in header]
-                writer.writerow(row)
-            console.print(f"[green][✓] csv entry added: {record['url']}[/green]")
+            self._csv_writer.writerow(record)
         except Exception as e:
-            console.print(f"[red][!] error writing to csv ({csv_path}): {e}[/red]")
+            console.print(f"[red][!] error writing to csv ({self._csv_fh.name}): {e}[/red]")
+
+        self._pending += 1
+        if self._pending >= FLUSH_EVERY:
+            self._pending = 0
+            self._jsonl_fh.flush()
+            self._csv_fh.flush()
 
 
 # cli parser
@@ -392,6 +703,8 @@ def print_banner():
     """
     Prints the ASCII banner.
     """
+    from rich.panel import Panel
+    from rich.text import Text
     banner = Text("""
 ██╗███╗   ██╗████████╗██████╗  ██████╗ ██╗   ██╗███████╗██████╗ ████████╗
 ██║████╗  ██║╚══██╔══╝██╔══██╗██╔═══██╗██║   ██║██╔════╝██╔══██╗╚══██╔══╝
@@ -409,6 +722,7 @@ def print_help_table():
     """
     Prints the available parameters in a formatted table.
     """
+    from rich.table import Table
     table = Table(title="available parameters", show_header=True, header_style="bold green")
     table.add_column("parameter", style="cyan", no_wrap=True)
     table.add_column("description", style="white")
@@ -452,11 +766,16 @@ def main():
         return
 
     scanner = Scanner(args, dorks)
+    if not scanner.output_ready:
+        console.print("[red][!] output files not available. exiting.[/red]")
+        return
+
     try:
         asyncio.run(scanner.run())
     except KeyboardInterrupt:
         console.print("[red][!] interrupted by user.[/red]")
     finally:
+        scanner.close()
         console.print(f"[green][+] done. results saved to: {args.output_dir}[/green]")
         console.print(f"    - jsonl: {os.path.join(args.output_dir,'results.jsonl')}")
         console.print(f"    - csv:  {os.path.join(args.output_dir,'results.csv')}")
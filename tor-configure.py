@@ -1,25 +1,10 @@
 #!/usr/bin/env python3
-import os
-import json
-import csv
-from collections import Counter, defaultdict
-from urllib.parse import urlparse
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 import sys
 import asyncio
-import time
 import shutil
 import re
 from rich.console import Console
 from rich.panel import Panel
-from rich.text import Text
-from stem import process
-from stem.util import term
-import socks
-import socket
 
 console = Console()
 